@@ -8,15 +8,75 @@ Usage:
     python xlsx_to_html_table.py input.xlsx            # prints table to stdout (uses first sheet)
     python xlsx_to_html_table.py input.xlsx -s Sheet1  # use sheet named "Sheet1"
     python xlsx_to_html_table.py input.xlsx -n         # treat file as no-header (all rows in <tbody>)
+    python xlsx_to_html_table.py input.xlsx -f         # keep merged cells, number formats, hyperlinks and styles
     python xlsx_to_html_table.py input.xlsx -o out.html
+    python xlsx_to_html_table.py input.xlsx -c Name,Amount -w "Amount>100" --sort-by Amount --desc --limit 20
 """
 
 import argparse
+import heapq
+import operator
+import pickle
+import re
 import sys
+import tempfile
+from itertools import chain, islice
 from openpyxl import load_workbook
-from datetime import datetime, date
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.utils import column_index_from_string, get_column_letter
+from datetime import datetime, date, time
 import html
 
+# Number format pieces that don't affect the rendered text
+FORMAT_NOISE_RE = re.compile(r"\[[^\]]*\]|_.|\*.|\\")
+FORMAT_LITERAL_RE = re.compile(r'"([^"]*)"')
+NUMBER_CORE_RE = re.compile(r"[#0?,]*[#0?](?:\.[#0?]+)?|\.[#0?]+")
+EXPONENT_RE = re.compile(r"[eE][+-][#0]+")
+DATE_TOKEN_RE = re.compile(r"yyyy|yy|mmmm|mmm|mm|m|dddd|ddd|dd|d|hh|h|ss|s|am/pm|a/p|\.0+", re.I)
+
+DATE_TOKENS = {
+    "yyyy": lambda v, h12: f"{v.year:04d}",
+    "yy": lambda v, h12: f"{v.year % 100:02d}",
+    "mmmm": lambda v, h12: v.strftime("%B"),
+    "mmm": lambda v, h12: v.strftime("%b"),
+    "mm": lambda v, h12: f"{v.month:02d}",
+    "m": lambda v, h12: str(v.month),
+    "dddd": lambda v, h12: v.strftime("%A"),
+    "ddd": lambda v, h12: v.strftime("%a"),
+    "dd": lambda v, h12: f"{v.day:02d}",
+    "d": lambda v, h12: str(v.day),
+    "hh": lambda v, h12: f"{(v.hour % 12 or 12) if h12 else v.hour:02d}",
+    "h": lambda v, h12: str((v.hour % 12 or 12) if h12 else v.hour),
+    "minute2": lambda v, h12: f"{v.minute:02d}",
+    "minute": lambda v, h12: str(v.minute),
+    "ss": lambda v, h12: f"{v.second:02d}",
+    "s": lambda v, h12: str(v.second),
+    "am/pm": lambda v, h12: "AM" if v.hour < 12 else "PM",
+    "a/p": lambda v, h12: "A" if v.hour < 12 else "P",
+}
+
+HORIZONTAL_ALIGN = {"left", "center", "right", "justify"}
+VERTICAL_ALIGN = {"top": "top", "center": "middle", "bottom": "bottom"}
+
+PREDICATE_RE = re.compile(r"^\s*(.+?)\s*(!=|>=|<=|=|>|<|~)\s*(.*?)\s*$")
+PREDICATE_OPS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+UNSAFE_URL_SCHEMES = ("javascript:", "vbscript:", "data:")
+# Characters browsers ignore inside a URL scheme (e.g. "java\tscript:")
+URL_IGNORED_RE = re.compile(r"[\x00-\x20]")
+
+# Rows held in memory per sorted run before spilling to a temporary file
+DEFAULT_SORT_BUFFER = 100000
+# Most sorted runs merged (and so open) at once; more are merged in stages
+MERGE_FAN_IN = 64
+
 def cell_to_text(cell_value):
     """Convert common excel cell values to a safe string for HTML."""
     if cell_value is None:
@@ -27,63 +87,564 @@ def cell_to_text(cell_value):
     # for floats/ints/bools just str()
     return str(cell_value)
 
-def sheet_to_html_table(ws, header=True):
+def compile_date_format(fmt):
+    """Compile an Excel date/time format into a function of a date/datetime/time."""
+    tokens = DATE_TOKEN_RE.split(fmt)
+    names = [t.lower() for t in DATE_TOKEN_RE.findall(fmt)]
+    h12 = any(n in ("am/pm", "a/p") for n in names)
+    # "m"/"mm" mean minutes right after an hour or right before seconds
+    for i, name in enumerate(names):
+        if name in ("m", "mm"):
+            after_hour = i > 0 and names[i - 1] in ("h", "hh")
+            before_second = i + 1 < len(names) and names[i + 1] in ("s", "ss")
+            if after_hour or before_second:
+                names[i] = "minute2" if name == "mm" else "minute"
+
+    def fmt_date(value):
+        parts = [tokens[0]]
+        for name, literal in zip(names, tokens[1:]):
+            if name.startswith("."):
+                micro = getattr(value, "microsecond", 0)
+                parts.append("." + f"{micro:06d}"[:len(name) - 1])
+            else:
+                try:
+                    parts.append(DATE_TOKENS[name](value, h12))
+                except AttributeError:
+                    # e.g. an hour token applied to a plain date
+                    parts.append("0")
+            parts.append(literal)
+        return "".join(parts)
+    return fmt_date
+
+def compile_number_format(fmt):
+    """
+    Compile an Excel number format into a function of a cell value, or None
+    when the value should just be stringified ("General", text, unsupported).
+    Handles fixed decimals, thousands separators, percentages, literal
+    prefixes/suffixes and common date/time formats (first section only).
+    """
+    if not fmt or fmt in ("General", "@"):
+        return None
+    section = fmt.split(";")[0]
+    section = FORMAT_NOISE_RE.sub("", FORMAT_LITERAL_RE.sub(r"\1", section))
+
+    if is_date_format(fmt):
+        return compile_date_format(section)
+
+    match = NUMBER_CORE_RE.search(section)
+    if not match or "/" in section:
+        # no digits placeholder, or a fraction format
+        return None
+    core = match.group(0)
+    integer, _, decimals = core.partition(".")
+    prefix, suffix = section[:match.start()], section[match.end():]
+    exponent = EXPONENT_RE.match(suffix)
+    if exponent:
+        spec = f"{{:.{len(decimals)}E}}"
+        suffix = suffix[exponent.end():]
+    else:
+        spec = "{:" + ("," if "," in integer else "") + f".{len(decimals)}f}}"
+    scale = 100 if "%" in section else 1
+    return lambda value: prefix + spec.format(value * scale) + suffix
+
+def build_merged_index(ws):
+    """
+    Index ws.merged_cells once per sheet.
+    Returns ({(row, col): (rowspan, colspan)} for each range's top-left cell,
+    set of (row, col) hidden under a merge, set of rows touched by a merge).
+    """
+    spans = {}
+    covered = set()
+    merged_rows = set()
+    for rng in ws.merged_cells.ranges:
+        spans[(rng.min_row, rng.min_col)] = (rng.max_row - rng.min_row + 1, rng.max_col - rng.min_col + 1)
+        for row in range(rng.min_row, rng.max_row + 1):
+            merged_rows.add(row)
+            for col in range(rng.min_col, rng.max_col + 1):
+                covered.add((row, col))
+        covered.discard((rng.min_row, rng.min_col))
+    return spans, covered, merged_rows
+
+def header_extent(spans, first_row):
+    """
+    Number of rows, starting at first_row, that form the header: the first
+    row plus every row covered by a merge starting within the header.
+    """
+    last = first_row
+    changed = True
+    while changed:
+        changed = False
+        for (row, col), (rowspan, colspan) in spans.items():
+            if first_row <= row <= last and row + rowspan - 1 > last:
+                last = row + rowspan - 1
+                changed = True
+    return last - first_row + 1
+
+def is_unsafe_url(url):
+    """True for links that would run script (javascript:, vbscript:, data:)."""
+    return URL_IGNORED_RE.sub("", url).lower().startswith(UNSAFE_URL_SCHEMES)
+
+def style_to_css(cell):
+    """CSS declarations for a cell's font, fill and alignment."""
+    css = []
+    font = cell.font
+    if font.b:
+        css.append("font-weight: bold")
+    if font.i:
+        css.append("font-style: italic")
+    if font.u:
+        css.append("text-decoration: underline")
+    if font.color is not None and isinstance(font.color.rgb, str) and len(font.color.rgb) == 8:
+        css.append(f"color: #{font.color.rgb[2:]}")
+    fill = cell.fill
+    if getattr(fill, "fill_type", None) == "solid" and isinstance(fill.fgColor.rgb, str) and len(fill.fgColor.rgb) == 8:
+        css.append(f"background-color: #{fill.fgColor.rgb[2:]}")
+    alignment = cell.alignment
+    if alignment.horizontal in HORIZONTAL_ALIGN:
+        css.append(f"text-align: {alignment.horizontal}")
+    if alignment.vertical in VERTICAL_ALIGN:
+        css.append(f"vertical-align: {VERTICAL_ALIGN[alignment.vertical]}")
+    if alignment.wrap_text:
+        css.append("white-space: pre-wrap")
+    return "; ".join(css)
+
+class StyleTable:
+    """
+    Per-sheet table mapping a cell's style id to (CSS class, number formatter).
+    Each distinct style is resolved once; cells sharing CSS share a class.
+    """
+    def __init__(self):
+        self.entries = {}
+        self.classes = {}
+
+    def lookup(self, cell):
+        style_id = cell.style_id
+        entry = self.entries.get(style_id)
+        if entry is None:
+            css = style_to_css(cell)
+            css_class = None
+            if css:
+                css_class = self.classes.setdefault(css, f"x{len(self.classes)}")
+            entry = (css_class, compile_number_format(cell.number_format))
+            self.entries[style_id] = entry
+        return entry
+
+    def stylesheet(self):
+        """A <style> block defining the classes in use, or "" if none."""
+        if not self.classes:
+            return ""
+        rules = "\n".join(f"  td.{name}, th.{name} {{ {css} }}" for css, name in self.classes.items())
+        return f"<style>\n{rules}\n</style>"
+
+def render_rich_cell(tag, cell, spans, styles):
+    """Render one cell with its span, style class, number format and hyperlink."""
+    attrs = ""
+    span = spans.get((cell.row, cell.column))
+    if span:
+        rowspan, colspan = span
+        if rowspan > 1:
+            attrs += f' rowspan="{rowspan}"'
+        if colspan > 1:
+            attrs += f' colspan="{colspan}"'
+
+    value = cell.value
+    css_class, formatter = styles.lookup(cell)
+    if css_class:
+        attrs += f' class="{css_class}"'
+
+    text = None
+    if formatter is not None and value is not None and not isinstance(value, (bool, str)):
+        try:
+            text = formatter(value)
+        except (TypeError, ValueError, AttributeError):
+            text = None
+    if text is None:
+        text = cell_to_text(value)
+    text = html.escape(text)
+
+    link = cell.hyperlink
+    if link is not None:
+        target = link.target or (f"#{link.location}" if link.location else None)
+        if target and not is_unsafe_url(target):
+            text = f'<a href="{html.escape(target)}">{text}</a>'
+    return f"      <{tag}{attrs}>{text}</{tag}>"
+
+def resolve_column(names, column, width):
+    """
+    Index of a column given by header name or, failing that, Excel letter
+    (A, B, ...) within the sheet's width.
+    """
+    if column in names:
+        return names.index(column)
+    if column.isalpha():
+        try:
+            index = column_index_from_string(column.upper()) - 1
+        except ValueError:
+            index = None
+        if index is not None and index < width:
+            return index
+    available = ", ".join(names) if names else f"letters A-{get_column_letter(max(width, 1))}"
+    raise ValueError(f"column '{column}' not found. Available columns: {available}")
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def is_blank(value):
+    return value is None or (isinstance(value, str) and value.strip() == "")
+
+def compile_predicate(names, width, expr):
+    """
+    Compile "column OP value" (OP one of = != < <= > >= ~) into (index, test).
+    With a numeric value, < <= > >= only match numeric cells; otherwise
+    cells compare as text. ~ is a case-insensitive substring match.
+    """
+    match = PREDICATE_RE.match(expr)
+    if not match:
+        raise ValueError(f"invalid filter '{expr}', expected e.g. 'Amount>100' or 'Name~smith'")
+    column, op, operand = match.groups()
+    index = resolve_column(names, column, width)
+
+    if op == "~":
+        needle = operand.lower()
+        return index, lambda value: needle in cell_to_text(value).lower()
+
+    compare = PREDICATE_OPS[op]
+    try:
+        number = float(operand)
+    except ValueError:
+        number = None
+
+    def test(value):
+        if number is not None:
+            if is_number(value):
+                return compare(value, number)
+            if op not in ("=", "!="):
+                return False
+        return compare(cell_to_text(value), operand)
+    return index, test
+
+def sort_key(value):
+    """Sort key that orders mixed (non-blank) cell values: numbers, dates, times, then text."""
+    if isinstance(value, (int, float)):
+        return (0, value)
+    if isinstance(value, datetime):
+        return (1, value)
+    if isinstance(value, date):
+        return (1, datetime.combine(value, time()))
+    if isinstance(value, time):
+        return (2, value)
+    return (3, str(value))
+
+def spill_run(records):
+    """Write an already sorted run to a temporary file."""
+    f = tempfile.TemporaryFile()
+    for record in records:
+        pickle.dump(record, f, pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+def read_run(f):
+    while True:
+        try:
+            yield pickle.load(f)
+        except EOFError:
+            return
+
+def merge_runs(runs, key, reverse):
+    """Merge sorted run files into one new run file, closing the inputs."""
+    try:
+        return spill_run(heapq.merge(*(read_run(f) for f in runs), key=key, reverse=reverse))
+    finally:
+        for f in runs:
+            f.close()
+
+def external_sort(records, reverse=False, buffer_rows=DEFAULT_SORT_BUFFER):
+    """
+    Stable sort of (key, row) records. Runs of buffer_rows records are
+    sorted in memory and spilled to temporary files, then merged lazily.
+    Whenever MERGE_FAN_IN runs pile up they are merged into one, so the
+    number of open files stays bounded. buffer_rows=None sorts everything
+    in memory.
+    """
+    key = operator.itemgetter(0)
+    if buffer_rows is None:
+        yield from sorted(records, key=key, reverse=reverse)
+        return
+    runs = []
+    try:
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= buffer_rows:
+                chunk.sort(key=key, reverse=reverse)
+                runs.append(spill_run(chunk))
+                chunk = []
+                if len(runs) >= MERGE_FAN_IN:
+                    # runs are in input order, so merging them keeps the sort stable
+                    merged = merge_runs(runs, key, reverse)
+                    runs = [merged]
+        chunk.sort(key=key, reverse=reverse)
+        if not runs:
+            yield from chunk
+            return
+        yield from heapq.merge(*(read_run(f) for f in runs), chunk, key=key, reverse=reverse)
+    finally:
+        for f in runs:
+            f.close()
+
+class RowQuery:
+    """
+    Column projection, row filters, sort and limit, compiled once against
+    the header row. Filters read raw values and projection drops columns
+    before anything is formatted or escaped; sorting and limiting work on
+    the raw projected rows, so only emitted rows are rendered.
+    value reads a cell's value (None when rows are plain values).
+    sort_buffer=None sorts in memory (rows that can't be pickled).
+    """
+    def __init__(self, header_row, width, columns=None, where=None, sort_by=None, descending=False,
+                 limit=None, sort_buffer=DEFAULT_SORT_BUFFER, value=None):
+        self.value = value or (lambda cell: cell)
+        names = [cell_to_text(self.value(cell)).strip() for cell in header_row or ()]
+        self.indexes = [resolve_column(names, c, width) for c in columns] if columns else None
+        self.filters = [compile_predicate(names, width, expr) for expr in where or ()]
+        self.sort_index = resolve_column(names, sort_by, width) if sort_by else None
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be a positive number of rows, got {limit}")
+        if sort_buffer is not None and sort_buffer < 1:
+            raise ValueError(f"sort buffer must be a positive number of rows, got {sort_buffer}")
+        self.descending = descending
+        self.limit = limit
+        self.sort_buffer = sort_buffer
+
+    @property
+    def active(self):
+        return bool(self.indexes or self.filters) or self.sort_index is not None or self.limit is not None
+
+    def cell(self, row, index):
+        return self.value(row[index]) if index < len(row) else None
+
+    def project(self, row):
+        if self.indexes is None:
+            return row
+        return [row[i] if i < len(row) else None for i in self.indexes]
+
+    def run(self, rows, render_row):
+        """Yield render_row(projected row) for the selected rows, in order."""
+        if self.filters:
+            rows = (r for r in rows if all(test(self.cell(r, i)) for i, test in self.filters))
+
+        if self.sort_index is None:
+            for r in islice(rows, self.limit):
+                yield render_row(self.project(r))
+            return
+
+        # rows with a blank sort cell go last in either direction, in input order
+        blank_file = None
+        blanks = []
+
+        def keyed():
+            nonlocal blank_file
+            for r in rows:
+                value = self.cell(r, self.sort_index)
+                if not is_blank(value):
+                    yield sort_key(value), self.project(r)
+                elif self.limit is None or len(blanks) < self.limit:
+                    blanks.append(self.project(r))
+                    if self.sort_buffer is not None and len(blanks) >= self.sort_buffer:
+                        if blank_file is None:
+                            blank_file = tempfile.TemporaryFile()
+                        for row in blanks:
+                            pickle.dump(row, blank_file, pickle.HIGHEST_PROTOCOL)
+                        blanks.clear()
+
+        try:
+            if self.limit is not None:
+                pick = heapq.nlargest if self.descending else heapq.nsmallest
+                selected = pick(self.limit, keyed(), key=operator.itemgetter(0))
+            else:
+                selected = external_sort(keyed(), self.descending, self.sort_buffer)
+            emitted = 0
+            for _, row in selected:
+                emitted += 1
+                yield render_row(row)
+            # keyed() is exhausted once selection is done, so blanks are complete
+            remaining = ()
+            if blank_file is not None:
+                blank_file.seek(0)
+                remaining = read_run(blank_file)
+            for row in islice(chain(remaining, blanks), None if self.limit is None else self.limit - emitted):
+                yield render_row(row)
+        finally:
+            if blank_file is not None:
+                blank_file.close()
+
+def first_rows(rows, is_empty):
+    """
+    Advance a row iterator to its first non-empty row.
+    Returns that row (or the very first row if all are empty, None if there
+    are no rows); the iterator is left just after it.
+    """
+    first = None
+    for r in rows:
+        if first is None:
+            first = r
+        if not is_empty(r):
+            return r
+    return first
+
+def sheet_to_rich_html_table(ws, header=True, **query):
+    """
+    Like sheet_to_html_table, but keeps merged cells (rowspan/colspan),
+    number formats, hyperlinks and basic styles (as CSS classes).
+    The merge index and style table are built once per sheet. Merges are
+    dropped when rows or columns are selected, reordered or limited.
+    Needs a regular (not read-only) worksheet.
+    """
+    def is_empty(r):
+        return all(cell.value is None or str(cell.value).strip() == "" for cell in r)
+
+    rows = ws.iter_rows()
+    first = first_rows(rows, is_empty)
+    if first is None:
+        return "<table></table>"
+
+    # the whole workbook is in memory already, so sort cells in memory too
+    query["sort_buffer"] = None
+    query = RowQuery(first if header else None, len(first), value=lambda cell: cell.value, **query)
+    if query.active:
+        spans, covered, merged_rows = {}, set(), set()
+    else:
+        spans, covered, merged_rows = build_merged_index(ws)
+    styles = StyleTable()
+
+    def render_row(r, tag="td"):
+        parts = ["    <tr>"]
+        for cell in r:
+            if cell is None:
+                parts.append(f"      <{tag}></{tag}>")
+            elif (cell.row, cell.column) not in covered:
+                parts.append(render_rich_cell(tag, cell, spans, styles))
+        parts.append("    </tr>")
+        return "\n".join(parts)
+
+    html_parts = []
+    html_parts.append("<table>")
+
+    body = chain([first], rows)
+    if header:
+        # rows covered by a merged header cell belong to <thead> too, since
+        # browsers clip rowspans at the row group boundary
+        header_rows = header_extent(spans, first[0].row)
+        html_parts.append("  <thead>")
+        for r in islice(body, header_rows):
+            html_parts.append(render_row(query.project(r), "th"))
+        html_parts.append("  </thead>")
+
+    html_parts.append("  <tbody>")
+    # skip completely empty rows, unless a merged range spans them
+    body = (r for r in body if not r or r[0].row in merged_rows or not is_empty(r))
+    html_parts.extend(query.run(body, render_row))
+    html_parts.append("  </tbody>")
+
+    html_parts.append("</table>")
+
+    stylesheet = styles.stylesheet()
+    if stylesheet:
+        html_parts.insert(0, stylesheet)
+    return "\n".join(html_parts)
+
+def sheet_to_html_table(ws, header=True, fidelity=False, columns=None, where=None,
+                        sort_by=None, descending=False, limit=None, sort_buffer=DEFAULT_SORT_BUFFER):
     """
     Convert an openpyxl worksheet to a pure HTML table string.
+    Rows are streamed, so a read-only worksheet keeps memory flat.
     - header=True: first non-empty row will be used as <thead>.
+    - fidelity=True: keep merged cells, number formats, hyperlinks and styles
+      (see sheet_to_rich_html_table).
+    - columns: header names (or column letters) to keep, in output order.
+    - where: filters like "Amount>100" or "Name~smith", all must match.
+    - sort_by/descending: sort body rows by a column, blanks last; spills
+      to temporary files past sort_buffer rows.
+    - limit: keep at most this many body rows (after filtering and sorting).
+    Raises ValueError for unknown columns or malformed filters.
     """
-    rows = list(ws.iter_rows(values_only=True))
+    query = dict(columns=columns, where=where, sort_by=sort_by, descending=descending,
+                 limit=limit, sort_buffer=sort_buffer)
+    if fidelity:
+        return sheet_to_rich_html_table(ws, header=header, **query)
+
+    def is_empty(r):
+        return all(cell is None or str(cell).strip() == "" for cell in r)
+
+    rows = ws.iter_rows(values_only=True)
+    # find first non-empty row (helpful if there are leading blank rows)
+    first = first_rows(rows, is_empty)
     # If sheet is empty
-    if not rows:
+    if first is None:
         return "<table></table>"
 
-    # find first non-empty row index (helpful if there are leading blank rows)
-    first_non_empty = 0
-    for i, r in enumerate(rows):
-        if any(cell is not None and str(cell).strip() != "" for cell in r):
-            first_non_empty = i
-            break
+    query = RowQuery(first if header else None, len(first), **query)
+
+    def render_row(r):
+        parts = ["    <tr>"]
+        for cell in r:
+            text = html.escape(cell_to_text(cell))
+            parts.append(f"      <td>{text}</td>")
+        parts.append("    </tr>")
+        return "\n".join(parts)
 
     html_parts = []
     html_parts.append("<table>")
 
-    start_body = first_non_empty
+    body = rows
     if header:
-        header_row = rows[first_non_empty]
         html_parts.append("  <thead>")
         html_parts.append("    <tr>")
-        for cell in header_row:
+        for cell in query.project(first):
             text = html.escape(cell_to_text(cell))
             html_parts.append(f"      <th>{text}</th>")
         html_parts.append("    </tr>")
         html_parts.append("  </thead>")
-        start_body = first_non_empty + 1
+    else:
+        body = chain([first], rows)
 
     html_parts.append("  <tbody>")
-    for r in rows[start_body:]:
-        # skip completely empty trailing rows
-        if all(cell is None or str(cell).strip() == "" for cell in r):
-            continue
-        html_parts.append("    <tr>")
-        for cell in r:
-            text = html.escape(cell_to_text(cell))
-            html_parts.append(f"      <td>{text}</td>")
-        html_parts.append("    </tr>")
+    # skip completely empty trailing rows
+    body = (r for r in body if not is_empty(r))
+    html_parts.extend(query.run(body, render_row))
     html_parts.append("  </tbody>")
 
     html_parts.append("</table>")
     return "\n".join(html_parts)
 
+def positive_int(text):
+    """argparse type for options that take a row count."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer value: '{text}'")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return value
+
 def main(argv):
     p = argparse.ArgumentParser(description="Convert .xlsx worksheet to pure HTML <table> markup.")
     p.add_argument("xlsx", help="Input .xlsx file")
     p.add_argument("-s", "--sheet", help="Sheet name (default: first sheet)", default=None)
     p.add_argument("-n", "--no-header", help="Treat the sheet as having no header row", action="store_true")
     p.add_argument("-o", "--output", help="Output file (default: stdout)", default=None)
+    p.add_argument("-f", "--fidelity", help="Keep merged cells, number formats, hyperlinks and basic styles", action="store_true")
+    p.add_argument("-c", "--columns", help="Comma-separated header names (or column letters) to keep, in order", default=None)
+    p.add_argument("-w", "--where", help="Row filter like 'Amount>100' or 'Name~smith' (ops: = != < <= > >= ~); repeatable, all must match", action="append", default=None)
+    p.add_argument("--sort-by", help="Header name (or column letter) to sort rows by", default=None)
+    p.add_argument("--desc", help="Sort in descending order", action="store_true")
+    p.add_argument("--limit", help="Output at most this many rows", type=positive_int, default=None)
+    p.add_argument("--sort-buffer", help=f"Rows sorted in memory before spilling to disk (default: {DEFAULT_SORT_BUFFER})", type=positive_int, default=DEFAULT_SORT_BUFFER)
     args = p.parse_args(argv)
 
-    # load workbook with cached values (data_only=True), so we get evaluated values if present
-    wb = load_workbook(filename=args.xlsx, data_only=True)
+    # load workbook with cached values (data_only=True), so we get evaluated values if present;
+    # read-only mode streams rows, but fidelity mode needs merged cells and styles
+    wb = load_workbook(filename=args.xlsx, data_only=True, read_only=not args.fidelity)
     if args.sheet:
         if args.sheet not in wb.sheetnames:
             print(f"Error: sheet '{args.sheet}' not found. Available sheets: {', '.join(wb.sheetnames)}", file=sys.stderr)
@@ -92,7 +653,17 @@ def main(argv):
     else:
         ws = wb[wb.sheetnames[0]]
 
-    html_table = sheet_to_html_table(ws, header=not args.no_header)
+    columns = [c.strip() for c in args.columns.split(",")] if args.columns else None
+    try:
+        html_table = sheet_to_html_table(ws, header=not args.no_header, fidelity=args.fidelity,
+                                         columns=columns, where=args.where, sort_by=args.sort_by,
+                                         descending=args.desc, limit=args.limit, sort_buffer=args.sort_buffer)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    finally:
+        # read-only workbooks keep the file open until closed
+        wb.close()
 
     if args.output:
         with open(args.output, "w", encoding="utf-8") as f:
@@ -8,9 +8,21 @@ Usage:
 
 import yaml
 import argparse
+import gzip
+import html
+import json
+import re
 import sys
+import time
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
@@ -353,6 +365,401 @@ function toggleModel(header) {{
 '''
 
 
+@lru_cache(maxsize=None)
+def escape_text(text):
+    """HTML-escape a spec string, memoized since specs repeat many strings."""
+    return html.escape(text)
+
+
+BLOCK_TAGS = ('<p>', '<ul>', '<ol>', '<pre>', '<blockquote>',
+              '<h1>', '<h2>', '<h3>', '<h4>', '<h5>', '<h6>')
+
+# Keys whose values are literal data, never Markdown
+LITERAL_KEYS = ('example', 'examples', 'x-example', 'default', 'enum')
+
+# Top-level sections of reusable components, only used when referenced
+COMPONENT_SECTIONS = ('definitions', 'parameters', 'responses')
+COMPONENT_OWNERS = tuple(f'#/{section}' for section in COMPONENT_SECTIONS)
+
+INLINE_CODE_RE = re.compile(r'(`+)(.+?)\1', re.S)
+# Link destinations may contain one level of balanced parentheses
+LINK_RE = re.compile(r'\[([^\]]+)\]\(((?:[^()\s]|\([^()\s]*\))+)\)')
+STRONG_RE = re.compile(r'\*\*(?=\S)(.+?)(?<=\S)\*\*|(?<!\w)__(?=\S)(.+?)(?<=\S)__(?!\w)', re.S)
+EM_RE = re.compile(r'\*(?=\S)(.+?)(?<=\S)\*|(?<!\w)_(?=\S)(.+?)(?<=\S)_(?!\w)', re.S)
+UNSAFE_URL_SCHEMES = ('javascript:', 'vbscript:', 'data:')
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+BULLET_RE = re.compile(r'^\s{0,3}[-*+]\s+(.*)$')
+ORDERED_RE = re.compile(r'^\s{0,3}\d+[.)]\s+(.*)$')
+
+
+def render_inline(text):
+    """Render inline Markdown (code, links, emphasis) in raw text to safe HTML."""
+    parts = []
+    pos = 0
+    for match in INLINE_CODE_RE.finditer(text):
+        parts.append(render_inline_text(text[pos:match.start()]))
+        parts.append(f'<code>{html.escape(match.group(2).strip())}</code>')
+        pos = match.end()
+    parts.append(render_inline_text(text[pos:]))
+    return ''.join(parts)
+
+
+def render_inline_text(text):
+    """Render links and emphasis in text that contains no code spans.
+
+    Links are split out first so emphasis never rewrites a URL, and the
+    label is rendered on its own.
+    """
+    parts = []
+    pos = 0
+    for match in LINK_RE.finditer(text):
+        parts.append(render_emphasis(text[pos:match.start()]))
+        label, url = match.groups()
+        label = render_emphasis(label)
+        if url.lower().startswith(UNSAFE_URL_SCHEMES):
+            parts.append(label)
+        else:
+            parts.append(f'<a href="{html.escape(url)}">{label}</a>')
+        pos = match.end()
+    parts.append(render_emphasis(text[pos:]))
+    return ''.join(parts)
+
+
+def render_emphasis(text):
+    """Escape plain text and render its bold/italic markers."""
+    text = html.escape(text)
+    text = STRONG_RE.sub(lambda m: f'<strong>{m.group(1) or m.group(2)}</strong>', text)
+    text = EM_RE.sub(lambda m: f'<em>{m.group(1) or m.group(2)}</em>', text)
+    return text
+
+
+@lru_cache(maxsize=4096)
+def render_markdown(text):
+    """Render a CommonMark description to HTML.
+
+    Covers the subset found in API specs: paragraphs, headings, lists,
+    block quotes, fenced code and inline code, links and emphasis.
+    A single paragraph is returned without a <p> wrapper so it drops
+    into the same places as plain text.
+    """
+    blocks = []
+    paragraph = []
+    list_tag = None
+    list_items = []
+    newline = '\n'
+    lines = text.strip('\n').split('\n')
+    i = 0
+
+    def flush():
+        nonlocal list_tag
+        if paragraph:
+            blocks.append(f'<p>{render_inline(newline.join(paragraph))}</p>')
+            paragraph.clear()
+        if list_tag:
+            items = ''.join(f'<li>{render_inline(item)}</li>' for item in list_items)
+            blocks.append(f'<{list_tag}>{items}</{list_tag}>')
+            list_items.clear()
+            list_tag = None
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if stripped.startswith('```') or stripped.startswith('~~~'):
+            flush()
+            fence = stripped[:3]
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith(fence):
+                code.append(lines[i])
+                i += 1
+            blocks.append(f'<pre><code>{html.escape(newline.join(code))}</code></pre>')
+        elif not stripped:
+            flush()
+        elif HEADING_RE.match(stripped):
+            flush()
+            level, title = HEADING_RE.match(stripped).groups()
+            blocks.append(f'<h{len(level)}>{render_inline(title)}</h{len(level)}>')
+        elif stripped.startswith('>'):
+            flush()
+            quote = []
+            while i < len(lines) and lines[i].strip().startswith('>'):
+                quote.append(lines[i].strip()[1:].lstrip())
+                i += 1
+            blocks.append(f'<blockquote>{render_markdown(newline.join(quote))}</blockquote>')
+            continue
+        elif BULLET_RE.match(line) or ORDERED_RE.match(line):
+            tag = 'ul' if BULLET_RE.match(line) else 'ol'
+            if paragraph or list_tag != tag:
+                flush()
+            list_tag = tag
+            list_items.append((BULLET_RE.match(line) or ORDERED_RE.match(line)).group(1))
+        elif list_tag and line[:1].isspace():
+            # Continuation line of the current list item
+            list_items[-1] += '\n' + stripped
+        else:
+            if list_tag:
+                flush()
+            paragraph.append(stripped)
+        i += 1
+    flush()
+
+    if len(blocks) == 1 and blocks[0].startswith('<p>'):
+        return blocks[0][3:-4]
+    return '\n'.join(blocks)
+
+
+def is_block_html(text):
+    """Whether rendered Markdown holds block elements rather than inline text.
+
+    YAML may load a description as a number or date; those are never block HTML.
+    """
+    return isinstance(text, str) and text.startswith(BLOCK_TAGS)
+
+
+def wrap_description(description, attrs=''):
+    """Wrap a description in <p>, or <div> when it holds block Markdown."""
+    tag = 'div' if is_block_html(description) else 'p'
+    return f'<{tag}{attrs}>{description}</{tag}>'
+
+
+def sanitize_spec(node, markdown=False, refs=None, memo=None, owner=None):
+    """Return a copy of the spec with every string key and value HTML-escaped.
+
+    Runs once after loading so the renderers can insert fields as-is.
+    With markdown=True, string `description` values are rendered through
+    render_markdown() instead. If a refs dict is given, every (escaped)
+    `$ref` value is mapped to the set of its owners: the reusable component
+    containing it (e.g. '#/definitions/Pet') or None when it is used from
+    anywhere else, such as paths. Nodes shared through YAML anchors are
+    only processed once (once per owner when collecting refs).
+    """
+    is_root = memo is None
+    if memo is None:
+        memo = {}
+    if isinstance(node, str):
+        return escape_text(node)
+    if not isinstance(node, (dict, list)):
+        return node
+
+    memo_key = (id(node), markdown) if refs is None else (id(node), markdown, owner)
+    if memo_key in memo:
+        return memo[memo_key]
+
+    if isinstance(node, dict):
+        result = {}
+        memo[memo_key] = result
+        for key, value in node.items():
+            if markdown and key == 'description' and isinstance(value, str):
+                result[key] = render_markdown(value)
+                continue
+            child_markdown = markdown and key not in LITERAL_KEYS
+            if isinstance(key, str):
+                key = escape_text(key)
+
+            child_owner = owner
+            if refs is not None:
+                if is_root and key in COMPONENT_SECTIONS:
+                    child_owner = f'#/{key}'
+                elif owner in COMPONENT_OWNERS:
+                    child_owner = f'{owner}/{key}'
+
+            result[key] = sanitize_spec(value, child_markdown, refs, memo, child_owner)
+            if refs is not None and key == '$ref' and isinstance(value, str):
+                refs.setdefault(result[key], set()).add(owner)
+    else:
+        result = []
+        memo[memo_key] = result
+        for item in node:
+            result.append(sanitize_spec(item, markdown, refs, memo, owner))
+    return result
+
+
+def unescape_value(node):
+    """Undo sanitize_spec() escaping on a value taken from the spec."""
+    if isinstance(node, str):
+        return html.unescape(node)
+    if isinstance(node, dict):
+        return {unescape_value(key): unescape_value(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [unescape_value(item) for item in node]
+    return node
+
+
+PATH_TEMPLATE_RE = re.compile(r'{([^}/]+)}')
+
+
+class SpecValidator:
+    """Lints a spec from the converter's own pass over it.
+
+    The converter feeds it the `$ref`s collected by sanitize_spec() and
+    each operation from its endpoint loop; problems are gathered as dicts
+    with level, code, location and message keys.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.problems = []
+        self._operation_ids = {}
+
+    def add(self, level, code, location, message):
+        """Record a problem, unescaping spec text for plain-text output."""
+        self.problems.append({
+            'level': level,
+            'code': code,
+            'location': html.unescape(location),
+            'message': html.unescape(message),
+        })
+
+    def resolve(self, ref):
+        """Resolve a local `#/...` reference, or return None."""
+        if not ref.startswith('#/'):
+            return None
+        node = self.spec
+        for part in ref[2:].split('/'):
+            part = part.replace('~1', '/').replace('~0', '~')
+            if not isinstance(node, dict) or part not in node:
+                return None
+            node = node[part]
+        return node
+
+    def check_operation(self, path, method, operation, path_parameters=()):
+        """Check operationId uniqueness and path parameters of one operation."""
+        location = f'{method.upper()} {path}'
+
+        operation_id = operation.get('operationId')
+        if operation_id:
+            if operation_id in self._operation_ids:
+                self.add('error', 'duplicate-operation-id', location,
+                         f"operationId '{operation_id}' is already used by "
+                         f"{self._operation_ids[operation_id]}")
+            else:
+                self._operation_ids[operation_id] = location
+
+        placeholders = set(PATH_TEMPLATE_RE.findall(path))
+        for param in list(path_parameters or []) + (operation.get('parameters') or []):
+            if not isinstance(param, dict):
+                continue
+            if '$ref' in param:
+                param = self.resolve(param['$ref']) or {}
+            if param.get('in') == 'path' and param.get('name') not in placeholders:
+                self.add('error', 'path-parameter-not-in-template', location,
+                         f"path parameter '{param.get('name')}' does not appear in the path")
+
+    def check_refs(self, refs):
+        """Report unresolved references and definitions nothing refers to.
+
+        refs maps each `$ref` to its owners, as collected by sanitize_spec().
+        A definition counts as used only if it is reachable from refs made
+        outside the reusable components, following refs transitively.
+        """
+        for ref in sorted(refs):
+            if ref.startswith('#/') and self.resolve(ref) is None:
+                self.add('error', 'unresolved-ref', ref, f"'$ref' target '{ref}' does not exist")
+
+        uses = {}
+        for ref, owners in refs.items():
+            for owner in owners:
+                uses.setdefault(owner, set()).add(ref)
+
+        reached = set()
+        pending = list(uses.get(None, ()))
+        while pending:
+            ref = pending.pop()
+            if ref not in reached:
+                reached.add(ref)
+                pending.extend(uses.get(ref, ()))
+
+        for name in self.spec.get('definitions', {}):
+            if f'#/definitions/{name}' not in reached:
+                self.add('warning', 'unused-definition', f'#/definitions/{name}',
+                         f"definition '{name}' is never referenced")
+
+    def report(self, report_file=None):
+        """Print the problems and optionally write them to a JSON file."""
+        for problem in self.problems:
+            prefix = '[ERROR]' if problem['level'] == 'error' else '[WARNING]'
+            print(f"{prefix} {problem['code']} at {problem['location']}: {problem['message']}")
+        if report_file:
+            with open(report_file, 'w', encoding='utf-8') as f:
+                json.dump(self.problems, f, indent=2, ensure_ascii=False)
+
+
+PRE_BLOCK_RE = re.compile(r'(<pre\b.*?</pre>)', re.S)
+# A tag followed by whitespace and another tag; group 2/3 are the tag names
+TAG_GAP_RE = re.compile(r'(<(/?[A-Za-z!][\w-]*)[^>]*>)\s+(?=</?([A-Za-z][\w-]*))')
+# Elements whose surrounding whitespace never renders
+BLOCK_ELEMENTS = {
+    '!doctype', 'html', 'head', 'body', 'meta', 'title', 'style', 'script',
+    'div', 'p', 'ul', 'ol', 'li', 'pre', 'blockquote', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'table', 'thead', 'tbody', 'tr', 'th', 'td',
+}
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Chunk size for streaming the page to the output and compressed files
+WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def minify_html(markup):
+    """Drop indentation around block tags and collapse whitespace, keeping <pre> intact."""
+    parts = PRE_BLOCK_RE.split(markup)
+    for i in range(0, len(parts), 2):
+        parts[i] = WHITESPACE_RE.sub(' ', TAG_GAP_RE.sub(close_tag_gap, parts[i]))
+    return ''.join(parts)
+
+
+def close_tag_gap(match):
+    """Drop whitespace next to a block-level tag, keep one space between inline ones."""
+    before = match.group(2).lstrip('/').lower()
+    after = match.group(3).lower()
+    if before in BLOCK_ELEMENTS or after in BLOCK_ELEMENTS:
+        return match.group(1)
+    return match.group(1) + ' '
+
+
+@lru_cache(maxsize=None)
+def minified_template():
+    """HTML_TEMPLATE with its CSS/JS indentation collapsed, computed once."""
+    return minify_html(HTML_TEMPLATE)
+
+
+def write_output(output_file, page, compress=False):
+    """Write the page, plus .gz and .br (if brotli is installed) copies when
+    compress is set, streaming each chunk to all outputs in a single pass.
+
+    Returns the list of files written.
+    """
+    data = memoryview(page.encode('utf-8'))
+    written = [str(output_file)]
+
+    with ExitStack() as stack:
+        sinks = [stack.enter_context(open(output_file, 'wb')).write]
+        br_file = compressor = None
+
+        if compress:
+            gz_path = f'{output_file}.gz'
+            gz_file = stack.enter_context(gzip.GzipFile(gz_path, 'wb', compresslevel=9, mtime=0))
+            sinks.append(gz_file.write)
+            written.append(gz_path)
+
+            if brotli is not None:
+                br_path = f'{output_file}.br'
+                br_file = stack.enter_context(open(br_path, 'wb'))
+                compressor = brotli.Compressor(quality=11)
+                sinks.append(lambda chunk: br_file.write(compressor.process(chunk)))
+                written.append(br_path)
+
+        for start in range(0, len(data), WRITE_CHUNK_SIZE):
+            chunk = data[start:start + WRITE_CHUNK_SIZE]
+            for sink in sinks:
+                sink(chunk)
+
+        if compressor is not None:
+            br_file.write(compressor.finish())
+
+    return written
+
+
 def get_ref_name(ref_path):
     """Extract the definition name from a $ref path."""
     if isinstance(ref_path, dict) and '$ref' in ref_path:
@@ -388,11 +795,126 @@ def format_type(param, definitions=None):
     return f'<span class="param-type">{type_str}</span>'
 
 
-def render_parameters(parameters, definitions=None):
+PRIMITIVE_EXAMPLES = {
+    'string': 'string',
+    'integer': 0,
+    'number': 0.0,
+    'boolean': True,
+    'file': 'file',
+}
+
+FORMAT_EXAMPLES = {
+    'date': '2024-01-01',
+    'date-time': '2024-01-01T00:00:00Z',
+    'uuid': '00000000-0000-0000-0000-000000000000',
+    'email': 'user@example.com',
+    'uri': 'https://example.com',
+}
+
+
+class ExampleBuilder:
+    """Synthesizes example JSON bodies from schemas.
+
+    Examples are memoized per model and bounded by max_depth (nested
+    objects/arrays) and max_items (array length), so deep or recursive
+    definitions stay cheap and small.
+    """
+
+    def __init__(self, definitions, max_depth=3, max_items=1):
+        self.definitions = definitions or {}
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self._values = {}
+        self._rendered = {}
+        # (model, depth) pairs being built, to cut $ref/allOf cycles that
+        # would otherwise recurse without using up any depth
+        self._building = set()
+
+    def build(self, schema, depth=None):
+        """Return an example value for schema, nesting at most depth levels."""
+        if depth is None:
+            depth = self.max_depth
+        if not isinstance(schema, dict):
+            return None
+
+        if '$ref' in schema:
+            ref_name = get_ref_name(schema)
+            if ref_name not in self.definitions:
+                return None
+            key = (ref_name, depth)
+            if key in self._building:
+                return {}
+            if key not in self._values:
+                self._building.add(key)
+                try:
+                    self._values[key] = self.build(self.definitions[ref_name], depth)
+                finally:
+                    self._building.discard(key)
+            return self._values[key]
+
+        for key in ('example', 'default'):
+            if key in schema:
+                return schema[key]
+        if schema.get('enum'):
+            return schema['enum'][0]
+
+        if 'allOf' in schema:
+            merged = {}
+            for part in schema['allOf']:
+                value = self.build(part, depth)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+
+        schema_type = schema.get('type', 'object' if 'properties' in schema else None)
+        if schema_type == 'array':
+            if depth <= 0:
+                return []
+            item = self.build(schema.get('items', {}), depth - 1)
+            return [item] * self.max_items
+        if schema_type == 'object':
+            if depth <= 0:
+                return {}
+            example = {}
+            for prop_name, prop_schema in schema.get('properties', {}).items():
+                example[prop_name] = self.build(prop_schema, depth - 1)
+            additional = schema.get('additionalProperties')
+            if isinstance(additional, dict) and not example:
+                example['key'] = self.build(additional, depth - 1)
+            return example
+
+        return FORMAT_EXAMPLES.get(schema.get('format'), PRIMITIVE_EXAMPLES.get(schema_type))
+
+    def render(self, schema, title):
+        """Render an example for schema as a titled code block."""
+        ref_name = get_ref_name(schema)
+        if ref_name and ref_name in self._rendered:
+            body = self._rendered[ref_name]
+        else:
+            value = self.build(schema)
+            body = None
+            if value is not None:
+                # Serialize the original text, then escape the JSON once
+                body = json.dumps(unescape_value(value), indent=2, ensure_ascii=False, default=str)
+                body = html.escape(body, quote=False)
+            if ref_name:
+                self._rendered[ref_name] = body
+
+        if body is None:
+            return ''
+
+        block = f'<div class="section-title">{title}</div>\n'
+        block += f'<pre class="code-block">{body}</pre>\n'
+        return block
+
+
+def render_parameters(parameters, definitions=None, examples=None):
     """Render parameters table."""
     if not parameters:
         return ""
 
+    body_schema = None
+
     html = '<div class="section-title">Parameters</div>\n'
     html += '<table class="param-table">\n'
     html += '  <thead>\n    <tr>\n'
@@ -414,6 +936,7 @@ def render_parameters(parameters, definitions=None):
                 type_str = format_type(schema, definitions)
 
             required = '<span class="required-badge">required</span>'
+            body_schema = schema
 
             html += f'    <tr>\n'
             html += f'      <td><code>{name}</code></td>\n'
@@ -440,10 +963,14 @@ def render_parameters(parameters, definitions=None):
             html += f'    </tr>\n'
 
     html += '  </tbody>\n</table>\n'
+
+    if examples and body_schema:
+        html += examples.render(body_schema, 'Example Request')
+
     return html
 
 
-def render_responses(responses):
+def render_responses(responses, examples=None):
     """Render responses section."""
     html = '<div class="collapsible-section">\n'
     html += '  <div class="collapsible-header" onclick="toggleSection(this)">\n'
@@ -464,7 +991,7 @@ def render_responses(responses):
         html += '  <div class="collapsible-content">\n\n'
 
         if description:
-            html += f'<p>{description}</p>\n\n'
+            html += f'{wrap_description(description)}\n\n'
 
         # Check for schema in response
         if 'schema' in response:
@@ -472,6 +999,8 @@ def render_responses(responses):
             if '$ref' in schema:
                 ref_name = get_ref_name(schema)
                 html += f'<p><strong>Response Model:</strong> <code>{ref_name}</code></p>\n'
+            if examples:
+                html += examples.render(schema, 'Example Response')
 
         html += '  </div>\n</div>\n\n'
 
@@ -479,7 +1008,7 @@ def render_responses(responses):
     return html
 
 
-def render_endpoint(path, method, operation, tag=None):
+def render_endpoint(path, method, operation, tag=None, definitions=None, examples=None):
     """Render a single endpoint."""
     summary = operation.get('summary', '')
     description = operation.get('description', '')
@@ -506,7 +1035,7 @@ def render_endpoint(path, method, operation, tag=None):
         if summary:
             html += f'      <strong>{summary}</strong>\n'
         if description:
-            html += f'      <p>{description}</p>\n'
+            html += f'      {wrap_description(description)}\n'
         html += '    </div>\n\n'
 
     # Parameters
@@ -517,12 +1046,12 @@ def render_endpoint(path, method, operation, tag=None):
         html += '    <span>📥 Request</span>\n'
         html += '  </div>\n'
         html += '  <div class="collapsible-content">\n\n'
-        html += render_parameters(parameters)
+        html += render_parameters(parameters, definitions, examples)
         html += '  </div>\n</div>\n\n'
 
     # Responses
     if responses:
-        html += render_responses(responses)
+        html += render_responses(responses, examples)
 
     html += '  </div>\n</div>\n\n'
     return html
@@ -547,7 +1076,10 @@ def render_model(name, schema):
     html += '  <div class="model-body">\n'
 
     if description:
-        html += f'    <p><em>{description}</em></p>\n\n'
+        if is_block_html(description):
+            html += f'    <div style="font-style: italic;">{description}</div>\n\n'
+        else:
+            html += f'    <p><em>{description}</em></p>\n\n'
 
     # For enum types
     if enum_values:
@@ -592,13 +1124,33 @@ def render_model(name, schema):
     return html
 
 
-def convert_yaml_to_html(yaml_file, output_file):
-    """Convert Swagger YAML to interactive HTML."""
+def convert_yaml_to_html(yaml_file, output_file, markdown=False, examples=False,
+                         example_depth=3, example_items=1, minify=False, compress=False,
+                         validate=False, strict=False, validation_report=None):
+    """Convert Swagger YAML to interactive HTML.
+
+    With markdown=True, `description` fields are rendered as CommonMark.
+    With examples=True, example request/response bodies are generated
+    from their schemas, limited by example_depth and example_items.
+    With minify=True, whitespace is collapsed; with compress=True,
+    precompressed .gz/.br files are written next to the output.
+    With validate=True, the spec is linted during the same pass; problems
+    are printed (and written to validation_report as JSON if given), and
+    with strict=True any problem fails the conversion.
+    """
+    validate = validate or strict or bool(validation_report)
+    started = time.perf_counter()
+    markdown_stats = render_markdown.cache_info()
     try:
         # Load YAML file
         with open(yaml_file, 'r', encoding='utf-8') as f:
             spec = yaml.safe_load(f)
 
+        # Escape all YAML-sourced text once, up front
+        refs = {} if validate else None
+        spec = sanitize_spec(spec, markdown=markdown, refs=refs)
+        validator = SpecValidator(spec) if validate else None
+
         # Extract basic info
         info = spec.get('info', {})
         title = info.get('title', 'API Documentation')
@@ -617,10 +1169,16 @@ def convert_yaml_to_html(yaml_file, output_file):
         content += '  </div>\n'
 
         if description:
-            content += f'  <p style="margin-top: 15px; opacity: 0.95;">{description}</p>\n'
+            header_style = ' style="margin-top: 15px; opacity: 0.95;"'
+            content += f'  {wrap_description(description, attrs=header_style)}\n'
 
         content += '</div>\n\n'
 
+        definitions = spec.get('definitions', {})
+        example_builder = None
+        if examples:
+            example_builder = ExampleBuilder(definitions, example_depth, example_items)
+
         # Endpoints section
         paths = spec.get('paths', {})
         if paths:
@@ -631,24 +1189,47 @@ def convert_yaml_to_html(yaml_file, output_file):
                     if method in ['get', 'post', 'put', 'delete', 'patch', 'options', 'head']:
                         tags = operation.get('tags', [])
                         tag = tags[0] if tags else None
-                        content += render_endpoint(path, method, operation, tag)
+                        content += render_endpoint(path, method, operation, tag,
+                                                   definitions, example_builder)
+                        if validator:
+                            validator.check_operation(path, method, operation,
+                                                      methods.get('parameters') or [])
 
         # Models/Definitions section
-        definitions = spec.get('definitions', {})
         if definitions:
             content += '<h2 class="section-header">📦 Data Models</h2>\n\n'
 
             for def_name, def_schema in definitions.items():
                 content += render_model(def_name, def_schema)
 
+        if validator:
+            validator.check_refs(refs)
+            validator.report(validation_report)
+            if strict and validator.problems:
+                print(f"[ERROR] Validation failed with {len(validator.problems)} problem(s)")
+                return False
+
         # Generate final HTML
-        html = HTML_TEMPLATE.format(title=title, content=content)
+        if minify:
+            html = minified_template().format(title=title, content=minify_html(content))
+        else:
+            html = HTML_TEMPLATE.format(title=title, content=content)
 
         # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        print(f"[SUCCESS] Successfully converted {yaml_file} to {output_file}")
+        if compress and brotli is None:
+            print("[WARNING] brotli is not installed, skipping .br output")
+        written = write_output(output_file, html, compress)
+
+        print(f"[SUCCESS] Successfully converted {yaml_file} to {', '.join(written)}")
+
+        timing = f"[INFO] Converted in {time.perf_counter() - started:.3f}s"
+        if markdown:
+            info = render_markdown.cache_info()
+            hits = info.hits - markdown_stats.hits
+            misses = info.misses - markdown_stats.misses
+            rate = hits / (hits + misses) * 100 if hits + misses else 0.0
+            timing += f" | Markdown cache: {hits} hits, {misses} misses ({rate:.1f}% hit rate)"
+        print(timing)
         return True
 
     except FileNotFoundError:
@@ -670,11 +1251,34 @@ def main():
 Examples:
   python yaml_to_swagger_html.py api.yaml -o api.html
   python yaml_to_swagger_html.py swagger.yaml -o docs/api-docs.html
+  python yaml_to_swagger_html.py swagger.yaml -o api.html --markdown
+  python yaml_to_swagger_html.py swagger.yaml -o api.html --examples --example-depth 2
+  python yaml_to_swagger_html.py swagger.yaml -o public/api.html --minify --compress
+  python yaml_to_swagger_html.py swagger.yaml -o api.html --strict
         '''
     )
 
     parser.add_argument('input', help='Input YAML file path')
     parser.add_argument('-o', '--output', required=True, help='Output HTML file path')
+    parser.add_argument('--markdown', action='store_true',
+                        help='Render description fields as CommonMark')
+    parser.add_argument('--minify', action='store_true',
+                        help='Collapse whitespace and indentation in the output HTML')
+    parser.add_argument('--compress', action='store_true',
+                        help='Also write precompressed .gz (and .br if brotli is installed) files')
+    parser.add_argument('--validate', action='store_true',
+                        help='Report unresolved $refs, duplicate operationIds, path parameters '
+                             'missing from the path and unused definitions')
+    parser.add_argument('--strict', action='store_true',
+                        help='Validate and fail without writing output if any problem is found')
+    parser.add_argument('--validation-report', metavar='FILE',
+                        help='Validate and write the problems to FILE as JSON')
+    parser.add_argument('--examples', action='store_true',
+                        help='Generate example request/response bodies from schemas')
+    parser.add_argument('--example-depth', type=int, default=3,
+                        help='Maximum nesting depth of generated examples (default: 3)')
+    parser.add_argument('--example-items', type=int, default=1,
+                        help='Number of items in generated example arrays (default: 1)')
 
     args = parser.parse_args()
 
@@ -692,7 +1296,18 @@ Examples:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Convert
-    success = convert_yaml_to_html(args.input, args.output)
+    success = convert_yaml_to_html(
+        args.input, args.output,
+        markdown=args.markdown,
+        examples=args.examples,
+        example_depth=args.example_depth,
+        example_items=args.example_items,
+        minify=args.minify,
+        compress=args.compress,
+        validate=args.validate,
+        strict=args.strict,
+        validation_report=args.validation_report,
+    )
 
     sys.exit(0 if success else 1)
 